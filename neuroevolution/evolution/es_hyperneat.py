@@ -1,7 +1,6 @@
 """
 All logic concerning ES-HyperNEAT resides here.
 """
-import copy
 import neat
 import numpy as np
 from neuroevolution.evolution.hyperneat import query_cppn
@@ -188,7 +187,7 @@ class ESNetwork:
                 hidden_nodes.add((c.x2, c.y2))
             self.connections = set()
 
-        unexplored_hidden_nodes = copy.deepcopy(hidden_nodes)
+        unexplored_hidden_nodes = set(hidden_nodes)
 
         for _ in range(self.iteration_level):  # Explore from hidden.
             for x, y in unexplored_hidden_nodes:
@@ -222,13 +221,15 @@ class ESNetwork:
                                    for i in self.substrate.output_coordinates)
         true_connections = set()
 
-        initial_input_connections = copy.deepcopy(connections)
-        initial_output_connections = copy.deepcopy(connections)
+        # Shallow copies are enough here: the loops below only read the
+        # coordinates and remove entries, they never mutate a Connection.
+        initial_input_connections = set(connections)
+        initial_output_connections = set(connections)
 
         add_happened = True
         while add_happened:  # The path from inputs.
             add_happened = False
-            temp_input_connections = copy.deepcopy(initial_input_connections)
+            temp_input_connections = set(initial_input_connections)
             for c in temp_input_connections:
                 if (c.x1, c.y1) in connected_to_inputs:
                     connected_to_inputs.add((c.x2, c.y2))
@@ -238,7 +239,7 @@ class ESNetwork:
         add_happened = True
         while add_happened:  # The path to outputs.
             add_happened = False
-            temp_output_connections = copy.deepcopy(initial_output_connections)
+            temp_output_connections = set(initial_output_connections)
             for c in temp_output_connections:
                 if (c.x2, c.y2) in connected_to_outputs:
                     connected_to_outputs.add((c.x1, c.y1))
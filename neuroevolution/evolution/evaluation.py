@@ -1,6 +1,7 @@
 """Implements the core evolution algorithm."""
 from typing import List, Callable, Dict
 
+import numpy as np
 from neat.math_util import mean
 from neat.genome import DefaultGenome
 from neuroevolution.evolution.fitness_functions.basic_fitness import BasicFitness
@@ -30,6 +31,8 @@ class Evaluation:
         self.evaluation_threshold = evaluation_threshold
         self.evaluated_genomes : Dict[int, DefaultGenome] = {}
         self.summarizer = self.get_fitness_summarizer()
+        self._evaluated_ids_cache: List[int] = []
+        self._evaluated_ids_dirty = False
 
     def get_fitness_summarizer(self) -> FitnessSummarizer:
         """
@@ -47,9 +50,13 @@ class Evaluation:
         """
         Get the best genome from the evaluated genomes.
         """
-        best = max(self.evaluated_genomes, key=lambda x: self.evaluated_genomes[x].fitness)
-        genome = self.evaluated_genomes[best]
-        return genome
+        genomes = list(self.evaluated_genomes.values())
+        fitnesses = np.fromiter(
+            (genome.fitness for genome in genomes),
+            dtype=np.float64,
+            count=len(genomes),
+        )
+        return genomes[int(fitnesses.argmax())]
 
     def evaluate(self, genome_id: int, genome: DefaultGenome, **kwargs):
         """
@@ -59,6 +66,7 @@ class Evaluation:
         """
         self.fitness_function(genome, **kwargs)  # Assuming each genome has a fitness attribute
         self.evaluated_genomes.update({genome_id: genome})
+        self._evaluated_ids_dirty = True
     
     def threshold_reached(self) -> bool:
         """
@@ -71,8 +79,15 @@ class Evaluation:
         else:
             return False
         
-    def get_evaluated(self) -> List[int]: 
-        return list(self.evaluated_genomes.keys())
+    def get_evaluated(self) -> List[int]:
+        # Rebuilt only after an evaluation changed the set; repeated polls in
+        # between return the cached snapshot.
+        if self._evaluated_ids_dirty:
+            self._evaluated_ids_cache = list(self.evaluated_genomes.keys())
+            self._evaluated_ids_dirty = False
+        return self._evaluated_ids_cache
 
-    def clear_evaluated(self): 
+    def clear_evaluated(self):
         self.evaluated_genomes.clear()
+        self._evaluated_ids_cache = []
+        self._evaluated_ids_dirty = False
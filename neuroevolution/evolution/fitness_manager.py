@@ -1,5 +1,7 @@
 
 from typing import List
+
+import numpy as np
 from neat.math_util import mean
 
 from neuroevolution.evolution.species import MixedGenerationSpecies
@@ -17,10 +19,13 @@ class FitnessManager:
         :param evaluated_genome_ids: A list of genome IDs that have been evaluated.
         """
         self.all_new_fitnesses = []
-        for species in active_species: 
-            active_genomes = {gid: genome for gid, genome in species.members.items() if gid in evaluated_genome_ids}
-            new_fitnesses = [genome.fitness for genome in active_genomes.values()]
-            self.all_new_fitnesses.extend(new_fitnesses)
+        evaluated_ids = set(evaluated_genome_ids)
+        for species in active_species:
+            self.all_new_fitnesses.extend(
+                genome.fitness
+                for gid, genome in species.members.items()
+                if gid in evaluated_ids
+            )
     
     def adjust_fitnesses(self, active_species: List[MixedGenerationSpecies], evaluated_genome_ids: List[int]):
         """
@@ -33,8 +38,9 @@ class FitnessManager:
         self.collect_new_fitnesses(active_species, evaluated_genome_ids)
         if not self.all_new_fitnesses:
             return []
-        min_fitness = min(self.all_new_fitnesses)
-        max_fitness = max(self.all_new_fitnesses)
+        fitness_array = np.asarray(self.all_new_fitnesses, dtype=np.float64)
+        min_fitness = fitness_array.min()
+        max_fitness = fitness_array.max()
         new_fitness_range = max(1.0, max_fitness - min_fitness) if max_fitness != min_fitness else 1.0
         adjusted_fitnesses = []
         for species in active_species:
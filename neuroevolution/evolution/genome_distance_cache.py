@@ -9,8 +9,16 @@ class GenomeDistanceCache(object):
         self.misses = 0
 
     def __call__(self, genome0: DefaultGenome, genome1: DefaultGenome):
+        if genome0 is genome1:
+            # Self-distance is zero by definition; skip the cache entirely.
+            self.hits += 1
+            return 0.0
         g0 = genome0.key
         g1 = genome1.key
+        if g0 == g1:
+            # Same genome fetched through two references.
+            self.hits += 1
+            return 0.0
         d = self.distances.get((g0, g1))
         if d is None:
             # Distance is not already computed.
@@ -16,16 +16,32 @@ class Network:
 
     def receive_evaluation(self, user_data: 'UserData'):
         """Receive and process evaluation data for a genome."""
-        logging.info(f"Received evaluation for genome {user_data.genome_id}")
+        logging.info("Received evaluation for genome %s", user_data.genome_id)
         self.experiment.receive_evaluation(user_data)
 
-    def get_serialized_mediator(self) -> bytes:
-        """Serialize the network associated with a genome."""
+    def get_pickled_mediator(self) -> bytes:
+        """Serialize the network associated with a genome to raw pickle bytes."""
         genome_id, mediator = self.get_mediator()
         if mediator is None:
             return None
-        pickled = pickle.dumps((genome_id, mediator))
-        return base64.b64encode(pickled).decode('utf-8')
+        # HIGHEST_PROTOCOL emits a smaller, faster binary framing than the
+        # backwards-compatible default; both ends of this wire run the same
+        # Python, so there is nothing to stay compatible with.
+        return pickle.dumps((genome_id, mediator), protocol=pickle.HIGHEST_PROTOCOL)
+
+    def get_serialized_mediator(self) -> str:
+        """Serialize the network associated with a genome as base64 text.
+
+        Base64 inflates the payload by a third and costs an encode/decode on
+        each side; clients that can handle a binary body should prefer the
+        raw bytes from get_pickled_mediator.
+        """
+        pickled = self.get_pickled_mediator()
+        if pickled is None:
+            return None
+        # base64 output is pure ASCII; the ascii codec decodes it without
+        # the utf-8 multi-byte scanning.
+        return base64.b64encode(pickled).decode('ascii')
 
     def get_mediator(self) -> Tuple[int, 'RecurrentNetwork']:
         """Create a mediator network from a genome."""
@@ -1,4 +1,7 @@
 """This module contains the PhenotypeCreator class, which is responsible for creating a network from a genome using ES-HyperNEAT."""
+import types
+from typing import Dict, Iterable, List
+
 from neat.config import Config
 from neat.genome import DefaultGenome
 from neat.nn.feed_forward import FeedForwardNetwork
@@ -8,10 +11,14 @@ from neuroevolution.evolution.substrate import Substrate
 
 # Constants
 # interpolate so we have 3 THREEE coordinates
-INPUT_COORDINATES = [(-0.33, -1.), (0, 0), (0.33, 1.)]
-OUTPUT_COORDINATES = [(-0.5, 1.), (0., -1.), (0., -1.), (0.5, 1.)]
+# Kept as immutable tuples: ES-HyperNEAT hashes the coordinates into
+# coords_to_id, so they must stay hashable.
+INPUT_COORDINATES = ((-0.33, -1.), (0, 0), (0.33, 1.))
+OUTPUT_COORDINATES = ((-0.5, 1.), (0., -1.), (0., -1.), (0.5, 1.))
 SUBSTRATE = Substrate(INPUT_COORDINATES, OUTPUT_COORDINATES,)
-PARAMS = {
+# Read-only view so the shared params can be handed to every ESNetwork by
+# reference without risking mutation (ESNetwork only reads the keys).
+PARAMS = types.MappingProxyType({
     "initial_depth": 1,
     "max_depth": 2,
     "variance_threshold": 0.03,
@@ -20,14 +27,30 @@ PARAMS = {
     "division_threshold": 0.5,
     "max_weight": 8.0,
     "activation": "sigmoid"
-}
+})
 
 class PhenotypeCreator:
     def __init__(self, config: Config):
         self.config = config
+        # Genome structure is fixed once a genome is created (mutation happens
+        # at reproduction, under a fresh key), so compiled networks can be
+        # reused across requests instead of rebuilt in the serving path.
+        self.network_cache: Dict[int, RecurrentNetwork] = {}
 
     def create_network_from_genome(self, genome: DefaultGenome) -> RecurrentNetwork:
-        """Create a network from a genome using ES-HyperNEAT."""
-        cppn = FeedForwardNetwork.create(genome, self.config)
-        es_network = ESNetwork(SUBSTRATE, cppn, PARAMS)
-        return es_network.create_phenotype_network()
+        """Create a network from a genome using ES-HyperNEAT, reusing cached networks."""
+        network = self.network_cache.get(genome.key)
+        if network is None:
+            cppn = FeedForwardNetwork.create(genome, self.config)
+            es_network = ESNetwork(SUBSTRATE, cppn, PARAMS)
+            network = es_network.create_phenotype_network()
+            self.network_cache[genome.key] = network
+        return network
+
+    def create_networks_from_genomes(self, genomes: Iterable[DefaultGenome]) -> List[RecurrentNetwork]:
+        """Create networks for a batch of genomes, reusing cached networks."""
+        return [self.create_network_from_genome(genome) for genome in genomes]
+
+    def discard_cached_network(self, genome_id: int) -> None:
+        """Drop the cached network for a genome that will not be served again."""
+        self.network_cache.pop(genome_id, None)
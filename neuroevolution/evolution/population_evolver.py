@@ -10,7 +10,7 @@ from neuroevolution.evolution.reproduction import MixedGenerationReproduction
 from neuroevolution.evolution.species_set import MixedGenerationSpeciesSet
 from neuroevolution.evolution.stagnation import MixedGenerationStagnation
 from neuroevolution.evolution.population_manager import PopulationManager
-from neuroevolution.evolution.evaluation import Evaluation
+from neuroevolution.evolution.evaluation import Evaluation, CompleteExtinctionException
 
 if TYPE_CHECKING:
     from neuroevolution.server.models import UserData
@@ -21,11 +21,6 @@ Population = Dict[int, DefaultGenome]
 SpeciesSet = MixedGenerationSpeciesSet
 State = Tuple[Population, SpeciesSet, int]
 
-class CompleteExtinctionException(Exception):
-    """Exception to raise when a population has no members."""
-    def __init__(self, message):
-        super().__init__(message)
-
 
 class PopulationEvolver:
     """
@@ -175,8 +170,14 @@ class PopulationEvolver:
 
     def start_reporting(self) -> None:
         """Start reporting the evolution process."""
+        if not self.reporters.reporters:
+            return
         self.reporters.start_generation(self.pop_manager.generation)
 
     def report_generation_end(self):
         """Report the end of a generation to all configured reporters."""
+        # Skip gathering the population/species snapshot when no reporter is
+        # registered to receive the broadcast.
+        if not self.reporters.reporters:
+            return
         self.reporters.end_generation(self.config, self.pop_manager.population, self.pop_manager.get_species_set())
\ No newline at end of file
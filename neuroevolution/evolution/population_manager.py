@@ -8,6 +8,7 @@ from neat.config import Config
 from neuroevolution.evolution.species_set import MixedGenerationSpeciesSet
 from neuroevolution.evolution.stagnation import MixedGenerationStagnation
 from neuroevolution.evolution.speciation import Speciation
+from neuroevolution.evolution.evaluation import CompleteExtinctionException
 
 if TYPE_CHECKING:
     from neuroevolution.server.models import UserData
@@ -15,11 +16,6 @@ if TYPE_CHECKING:
 # Type aliases for better readability
 Population = Dict[int, DefaultGenome]
 
-class CompleteExtinctionException(Exception):
-    """Exception to raise when a population has no members."""
-    def __init__(self, message):
-        super().__init__(message)
-
 class PopulationManager:
     """Manages the members of the population"""
 
@@ -28,6 +24,9 @@ class PopulationManager:
         self.generation = 0
         self.speciation = self.create_speciation(config)
         self.available_genomes = []
+        # Position of each available genome id inside available_genomes, so
+        # arbitrary removals are O(1) swap-pops instead of linear scans.
+        self._available_index = {}
 
     def create_speciation(self, config): 
         return Speciation(config)
@@ -42,6 +41,9 @@ class PopulationManager:
         self.speciation.species_set.reset()
         self.speciation.speciate(self.population, self.generation)
         self.available_genomes = self.get_all_genome_ids()
+        self._available_index = {
+            genome_id: index for index, genome_id in enumerate(self.available_genomes)
+        }
 
     def update_generation(self, offspring: Dict[int, DefaultGenome]):
         """
@@ -75,8 +77,9 @@ class PopulationManager:
         """
         Refresh the list of available genomes based on the current population.
         """
-        offspring_ids = offspring.keys()
-        self.available_genomes.extend(offspring_ids)
+        for genome_id in offspring.keys():
+            self._available_index[genome_id] = len(self.available_genomes)
+            self.available_genomes.append(genome_id)
 
     def mark_genome_as_unavailable(self, genome_id: int):
         """
@@ -84,10 +87,19 @@ class PopulationManager:
         
         :param genome_id: The ID of the genome to mark as unavailable.
         """
-        try:
-            self.available_genomes.remove(genome_id)
-        except ValueError:
+        index = self._available_index.get(genome_id)
+        if index is None:
             raise ValueError(f"Genome ID {genome_id} is not in the available genomes list.")
+        self._remove_available_at(index)
+
+    def _remove_available_at(self, index: int):
+        """Remove the entry at index by swapping the tail into its slot."""
+        removed_id = self.available_genomes[index]
+        last_id = self.available_genomes[-1]
+        self.available_genomes[index] = last_id
+        self._available_index[last_id] = index
+        self.available_genomes.pop()
+        del self._available_index[removed_id]
 
     def update_stagnation(self, stagnation: MixedGenerationStagnation, evaluated_ids: List[int]):
         """
@@ -151,8 +163,11 @@ class PopulationManager:
         """
         if not self.available_genomes:
             raise RuntimeError("No more genomes to send.")
-        genome_id = random.choice(self.available_genomes)
-        self.mark_genome_as_unavailable(genome_id)
+        index = random.randrange(len(self.available_genomes))
+        genome_id = self.available_genomes[index]
+        # Order is irrelevant for a random pool, so swap the tail into the
+        # vacated slot for an O(1) removal instead of list.remove's O(n) scan.
+        self._remove_available_at(index)
         return self.get_genome(genome_id)
     
     def remove_evaluated(self, evaluated: List[int]) -> None: 
@@ -3,6 +3,7 @@ Handles creation of genomes, either from scratch or by sexual or
 asexual reproduction from parents.
 """
 
+import logging
 from itertools import count
 from math import ceil
 from typing import List, Dict, TYPE_CHECKING, Tuple
@@ -80,7 +81,7 @@ class MixedGenerationReproduction(DefaultClassConfig):
             offspring = self.offspring_generator.create_offspring(sorted_parents, dying_parents_count, reproduction_cutoff)
             return offspring
         else:
-            print("No offspring created for species %s", species.key)
+            logging.debug("No offspring created for species %s", species.key)
             return {}
 
     def reproduce_evaluated(
@@ -2,11 +2,264 @@
 Generic runner for AI Gym - runs Neat, Hyperneat and ES-Hyperneat
 """
 
+import multiprocessing
+from collections import OrderedDict
+
 import neat
 import numpy as np
 from neuroevolution.evolution.hyperneat import create_phenotype_network
 from neuroevolution.evolution.es_hyperneat import ESNetwork
 
+# Per-step trace printing in the HyperNEAT runner. Off by default so the hot
+# loop does not evaluate the trace conditionals for every env step.
+DEBUG = False
+
+# Functional-equivalence cache: (structural genome hash, trial count) -> mean
+# fitness. Converged populations repeat topologies across genomes and
+# generations, so repeats skip network construction and the gym episodes
+# entirely. Keyed per trial count because the runners re-evaluate with 1, 10
+# and max_trials episodes and those means are not comparable.
+_FEC_CACHE_MAX = 50_000
+_fec_cache: "OrderedDict[tuple, float]" = OrderedDict()
+
+
+def genome_hash(genome):
+    """
+    Structural hash of a genome: sorted node and connection genes with
+    weights rounded to 4 decimals, so functionally equivalent genomes
+    collide on purpose. Memoized on the genome itself — structure never
+    changes after creation, so the gene walk runs once per genome instead
+    of once per generation.
+    """
+    cached = getattr(genome, "_structural_hash", None)
+    if cached is not None:
+        return cached
+    nodes = tuple(sorted(
+        (key, round(node.bias, 4), round(node.response, 4),
+         node.activation, node.aggregation)
+        for key, node in genome.nodes.items()
+    ))
+    connections = tuple(sorted(
+        (key, round(conn.weight, 4), conn.enabled)
+        for key, conn in genome.connections.items()
+    ))
+    digest = hash((nodes, connections))
+    genome._structural_hash = digest
+    return digest
+
+
+def _fec_get(key):
+    """Return the cached mean fitness for key, refreshing its LRU position."""
+    fitness = _fec_cache.get(key)
+    if fitness is not None:
+        _fec_cache.move_to_end(key)
+    return fitness
+
+
+def _fec_put(key, fitness):
+    """Store a mean fitness, evicting the least recently used entry when full."""
+    _fec_cache[key] = fitness
+    if len(_fec_cache) > _FEC_CACHE_MAX:
+        _fec_cache.popitem(last=False)
+
+
+# Phenotype memoization: structural genome hash -> (compiled network,
+# activation count). Phenotype construction dominates evaluation time for
+# ES-HyperNEAT, so repeat-structure genomes reuse the compiled network across
+# generations instead of rebuilding the CPPN and re-growing the substrate.
+_PHENOTYPE_CACHE_MAX = 10_000
+_phenotype_cache: "OrderedDict[int, tuple]" = OrderedDict()
+
+
+def _phenotype_get(key):
+    """Return the cached (net, activations) pair, refreshing its LRU position."""
+    phenotype = _phenotype_cache.get(key)
+    if phenotype is not None:
+        _phenotype_cache.move_to_end(key)
+    return phenotype
+
+
+def _phenotype_put(key, phenotype):
+    """Store a (net, activations) pair, evicting the LRU entry when full."""
+    _phenotype_cache[key] = phenotype
+    if len(_phenotype_cache) > _PHENOTYPE_CACHE_MAX:
+        _phenotype_cache.popitem(last=False)
+
+
+def _reset_run_caches():
+    """
+    Drop all cached fitnesses and phenotypes. The cache keys carry nothing
+    about the env, substrate, params or activation scheme, so entries are
+    only valid within a single run_es/run_hyper/run_neat invocation; a
+    later run with a different setup must start cold.
+    """
+    _fec_cache.clear()
+    _phenotype_cache.clear()
+
+
+# Evaluation context for the current run. The runners populate it before any
+# evaluation happens, so the module-level evaluation functions stay picklable
+# for the worker pool; forked workers inherit the context (including the gym
+# env, which is not picklable and must be per-process).
+_runner_ctx = {}
+
+
+def _eval_genome_es(genome, config):
+    """Evaluate a single genome for ES-HyperNEAT and return its mean fitness."""
+    ctx = _runner_ctx
+    trials = ctx["trials"]
+    structural_hash = genome_hash(genome)
+    fec_key = (structural_hash, trials)
+    cached_fitness = _fec_get(fec_key)
+    if cached_fitness is not None:
+        return cached_fitness
+
+    phenotype = _phenotype_get(structural_hash)
+    if phenotype is None:
+        cppn = neat.nn.FeedForwardNetwork.create(genome, config)
+        network = ESNetwork(ctx["substrate"], cppn, ctx["params"])
+        phenotype = (network.create_phenotype_network(), network.activations)
+        _phenotype_put(structural_hash, phenotype)
+    net, activations = phenotype
+
+    env = ctx["env"]
+    max_steps = ctx["max_steps"]
+    activate = net.activate
+    fit_buf = np.empty(trials, dtype=np.float64)
+
+    for trial in range(trials):
+        ob, _ = env.reset()
+        net.reset()
+
+        total_reward = 0
+
+        for _ in range(max_steps):
+            for _ in range(activations):
+                o = activate(ob)
+
+            action = o.index(max(o))
+            ob, reward, terminated, _, _ = env.step(action)
+            total_reward += reward
+            if terminated:
+                break
+
+        fit_buf[trial] = total_reward
+
+    fitness = float(fit_buf.mean())
+    _fec_put(fec_key, fitness)
+    return fitness
+
+
+def _eval_genome_hyper(genome, config, verbose=False):
+    """Evaluate a single genome for HyperNEAT and return its mean fitness."""
+    ctx = _runner_ctx
+    trials = ctx["trials"]
+    structural_hash = genome_hash(genome)
+    fec_key = (structural_hash, trials)
+    cached_fitness = _fec_get(fec_key)
+    if cached_fitness is not None:
+        return cached_fitness
+
+    activations = ctx["activations"]
+    phenotype = _phenotype_get(structural_hash)
+    if phenotype is None:
+        cppn = neat.nn.FeedForwardNetwork.create(genome, config)
+        phenotype = (create_phenotype_network(cppn, ctx["substrate"], ctx["activation"]),
+                     activations)
+        _phenotype_put(structural_hash, phenotype)
+    net, _ = phenotype
+
+    env = ctx["env"]
+    max_steps = ctx["max_steps"]
+    activate = net.activate
+    fit_buf = np.empty(trials, dtype=np.float64)
+
+    for i in range(trials):
+        ob, _ = env.reset()
+        if verbose:
+            print("Trial", i, "ob:", ob)
+        net.reset()
+
+        total_reward = 0
+
+        for othercount in range(max_steps):
+            for thirdcount in range(activations):
+                o = activate(ob)
+                if verbose and othercount < 2 and thirdcount < 2:
+                    print("Output", o)
+            action = o.index(max(o))
+            ob, reward, done, _, _ = env.step(action) # step returns Tuple[ObsType, float, bool, bool, dict]
+            if verbose and othercount < 2:
+                print("Reward", reward)
+            total_reward += reward
+            if done:
+                break
+        fit_buf[i] = total_reward
+
+    fitness = float(fit_buf.mean())
+    _fec_put(fec_key, fitness)
+    return fitness
+
+
+def _eval_genome_neat(genome, config):
+    """Evaluate a single genome for NEAT and return its mean fitness."""
+    ctx = _runner_ctx
+    trials = ctx["trials"]
+    fec_key = (genome_hash(genome), trials)
+    cached_fitness = _fec_get(fec_key)
+    if cached_fitness is not None:
+        return cached_fitness
+
+    net = neat.nn.FeedForwardNetwork.create(genome, config)
+
+    env = ctx["env"]
+    max_steps = ctx["max_steps"]
+    activate = net.activate
+    fit_buf = np.empty(trials, dtype=np.float64)
+
+    for trial in range(trials):
+        ob = env.reset()
+
+        total_reward = 0
+
+        for _ in range(max_steps):
+            o = activate(ob)
+            action = o.index(max(o))
+            ob, reward, done, _ = env.step(action)
+            total_reward += reward
+            if done:
+                break
+        fit_buf[trial] = total_reward
+
+    fitness = float(fit_buf.mean())
+    _fec_put(fec_key, fitness)
+    return fitness
+
+
+def _make_runner(eval_genome, eval_fitness, gens, num_workers):
+    """
+    Build the per-phase runner: serial eval_fitness by default, or a fresh
+    fork-context worker pool per phase when num_workers is set. A fresh pool
+    per phase means forked workers inherit the current trial count (and the
+    env, which cannot be pickled across processes).
+
+    The fork start method is requested explicitly: workers need _runner_ctx,
+    which only fork's copy-on-write inheritance provides. Under spawn (the
+    macOS/Windows default) workers would re-import this module with an empty
+    context and fail on the first evaluation.
+    """
+    def run_phase(pop):
+        if not num_workers:
+            return pop.run(eval_fitness, gens)
+        with multiprocessing.get_context("fork").Pool(num_workers) as pool:
+            def eval_parallel(genomes, config):
+                jobs = [pool.apply_async(eval_genome, (genome, config))
+                        for _, genome in genomes]
+                for job, (_, genome) in zip(jobs, genomes):
+                    genome.fitness = job.get()
+            return pop.run(eval_parallel, gens)
+    return run_phase
+
 
 def ini_pop(state, stats, config, output):
     """
@@ -19,50 +272,30 @@ def ini_pop(state, stats, config, output):
     return pop
 
 
-def run_es(gens, env, max_steps, config, params, substrate, max_trials=100, output=True):
+def run_es(gens, env, max_steps, config, params, substrate, max_trials=100, output=True,
+           num_workers=None):
     """
     Generic OpenAI Gym runner for ES-HyperNEAT.
     """
-    trials = 1
+    _reset_run_caches()
+    _runner_ctx.update(env=env, max_steps=max_steps, params=params,
+                       substrate=substrate, trials=1)
 
     def eval_fitness(genomes, config):
-
         for _, g in genomes:
-            cppn = neat.nn.FeedForwardNetwork.create(g, config)
-            network = ESNetwork(substrate, cppn, params)
-            net = network.create_phenotype_network()
-
-            fitnesses = []
+            g.fitness = _eval_genome_es(g, config)
 
-            for _ in range(trials):
-                ob, _ = env.reset()
-                net.reset()
-
-                total_reward = 0
-
-                for _ in range(max_steps):
-                    for _ in range(network.activations):
-                        o = net.activate(ob)
-
-                    action = np.argmax(o)
-                    ob, reward, terminated, _, _ = env.step(action)
-                    total_reward += reward
-                    if terminated:
-                        break
-
-                fitnesses.append(total_reward)
-
-            g.fitness = np.array(fitnesses).mean()
+    run_phase = _make_runner(_eval_genome_es, eval_fitness, gens, num_workers)
 
     # Create population and train the network. Return winner of network running 100 episodes.
     stats_one = neat.statistics.StatisticsReporter()
     pop = ini_pop(None, stats_one, config, output)
-    pop.run(eval_fitness, gens)
+    run_phase(pop)
 
     stats_ten = neat.statistics.StatisticsReporter()
     pop = ini_pop((pop.population, pop.species, 0), stats_ten, config, output)
-    trials = 10
-    winner_ten = pop.run(eval_fitness, gens)
+    _runner_ctx["trials"] = 10
+    winner_ten = run_phase(pop)
 
     if max_trials == 0:
         return winner_ten, (stats_one, stats_ten)
@@ -70,63 +303,37 @@ def run_es(gens, env, max_steps, config, params, substrate, max_trials=100, outp
     stats_hundred = neat.statistics.StatisticsReporter()
     pop = ini_pop((pop.population, pop.species, 0),
                   stats_hundred, config, output)
-    trials = max_trials
-    winner_hundred = pop.run(eval_fitness, gens)
+    _runner_ctx["trials"] = max_trials
+    winner_hundred = run_phase(pop)
     return winner_hundred, (stats_one, stats_ten, stats_hundred)
 
 
 def run_hyper(gens, env, max_steps, config, substrate, activations, max_trials=100,
-              activation="sigmoid", output=True):
+              activation="sigmoid", output=True, num_workers=None):
     """
     Generic OpenAI Gym runner for HyperNEAT.
     """
-    trials = 1
- 
+    _reset_run_caches()
+    _runner_ctx.update(env=env, max_steps=max_steps, substrate=substrate,
+                       activations=activations, activation=activation, trials=1)
+
     def eval_fitness(genomes, config):
         print("EVALUATING FITNESS")
 
         for count, g in genomes:
-            cppn = neat.nn.FeedForwardNetwork.create(g, config)
-            net = create_phenotype_network(cppn, substrate, activation)
-
-            fitnesses = []
-
-            for i in range(trials):
-                ob, _ = env.reset()
-                if(count < 2):
-                    print("Trial", i, "ob:", ob)
-                net.reset()
-
-                total_reward = 0
-
-                for othercount in range(max_steps):
-                    for thirdcount in range(activations):
-                        o = net.activate(ob)
-                        if(count < 2):
-                            if(othercount < 2):
-                                if(thirdcount < 2):
-                                    print("Output", o)
-                    action = np.argmax(o)
-                    ob, reward, done, _, _ = env.step(action) # step returns Tuple[ObsType, float, bool, bool, dict]
-                    if(count < 2):
-                        if(othercount < 2):
-                                print("Reward", reward)
-                    total_reward += reward
-                    if done:
-                        break
-                fitnesses.append(total_reward)
-
-            g.fitness = np.array(fitnesses).mean()
+            g.fitness = _eval_genome_hyper(g, config, verbose=DEBUG and count < 2)
+
+    run_phase = _make_runner(_eval_genome_hyper, eval_fitness, gens, num_workers)
 
     # Create population and train the network. Return winner of network running 100 episodes.
     stats_one = neat.statistics.StatisticsReporter()
     pop = ini_pop(None, stats_one, config, output)
-    pop.run(eval_fitness, gens)
+    run_phase(pop)
 
     stats_ten = neat.statistics.StatisticsReporter()
     pop = ini_pop((pop.population, pop.species, 0), stats_ten, config, output)
-    trials = 10
-    winner_ten = pop.run(eval_fitness, gens)
+    _runner_ctx["trials"] = 10
+    winner_ten = run_phase(pop)
 
     if max_trials == 0:
         return winner_ten, (stats_one, stats_ten)
@@ -134,49 +341,33 @@ def run_hyper(gens, env, max_steps, config, substrate, activations, max_trials=1
     stats_hundred = neat.statistics.StatisticsReporter()
     pop = ini_pop((pop.population, pop.species, 0),
                   stats_hundred, config, output)
-    trials = max_trials
-    winner_hundred = pop.run(eval_fitness, gens)
+    _runner_ctx["trials"] = max_trials
+    winner_hundred = run_phase(pop)
     return winner_hundred, (stats_one, stats_ten, stats_hundred)
 
 
-def run_neat(gens, env, max_steps, config, max_trials=100, output=True):
+def run_neat(gens, env, max_steps, config, max_trials=100, output=True, num_workers=None):
     """
     Generic OpenAI Gym runner for NEAT.
     """
-    trials = 1
+    _reset_run_caches()
+    _runner_ctx.update(env=env, max_steps=max_steps, trials=1)
 
     def eval_fitness(genomes, config):
-
         for _, g in genomes:
-            net = neat.nn.FeedForwardNetwork.create(g, config)
-
-            fitnesses = []
-
-            for _ in range(trials):
-                ob = env.reset()
-
-                total_reward = 0
-
-                for _ in range(max_steps):
-                    o = net.activate(ob)
-                    action = np.argmax(o)
-                    ob, reward, done, _ = env.step(action)
-                    total_reward += reward
-                    if done:
-                        break
-                fitnesses.append(total_reward)
+            g.fitness = _eval_genome_neat(g, config)
 
-            g.fitness = np.array(fitnesses).mean()
+    run_phase = _make_runner(_eval_genome_neat, eval_fitness, gens, num_workers)
 
     # Create population and train the network. Return winner of network running 100 episodes.
     stats_one = neat.statistics.StatisticsReporter()
     pop = ini_pop(None, stats_one, config, output)
-    pop.run(eval_fitness, gens)
+    run_phase(pop)
 
     stats_ten = neat.statistics.StatisticsReporter()
     pop = ini_pop((pop.population, pop.species, 0), stats_ten, config, output)
-    trials = 10
-    winner_ten = pop.run(eval_fitness, gens)
+    _runner_ctx["trials"] = 10
+    winner_ten = run_phase(pop)
 
     if max_trials == 0:
         return winner_ten, (stats_one, stats_ten)
@@ -184,6 +375,6 @@ def run_neat(gens, env, max_steps, config, max_trials=100, output=True):
     stats_hundred = neat.statistics.StatisticsReporter()
     pop = ini_pop((pop.population, pop.species, 0),
                   stats_hundred, config, output)
-    trials = max_trials
-    winner_hundred = pop.run(eval_fitness, gens)
+    _runner_ctx["trials"] = max_trials
+    winner_hundred = run_phase(pop)
     return winner_hundred, (stats_one, stats_ten, stats_hundred)
@@ -1,13 +1,23 @@
 from typing import Dict, List, Set, Tuple, Callable, TypeVar
+
+import numpy as np
+
 from neuroevolution.evolution.species_set import MixedGenerationSpeciesSet
 
 T = TypeVar('T')
 
 def find_closest_element(
-    target: T, 
-    candidates: Set[T], 
+    target: T,
+    candidates: Set[T],
     distance_fn: Callable[[T, T], float]
 ) -> T:
     """Returns the closest element in candidates to target."""
-    return min(candidates, key=lambda candidate: distance_fn(target, candidate))
-
+    if not candidates:
+        raise ValueError("find_closest_element() arg is an empty sequence")
+    candidate_list = list(candidates)
+    distances = np.fromiter(
+        (distance_fn(target, candidate) for candidate in candidate_list),
+        dtype=np.float64,
+        count=len(candidate_list),
+    )
+    return candidate_list[int(distances.argmin())]
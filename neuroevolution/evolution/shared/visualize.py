@@ -3,14 +3,13 @@ Varying visualisation tools.
 """
 
 import pickle
-import graphviz
-import matplotlib.pyplot as plt
 
- 
+
 def draw_net(net, filename=None, node_names={}, node_colors={}):
     """
     Draw neural network with arbitrary topology.
     """
+    import graphviz
     node_attrs = {
         'shape': 'circle',
         'fontsize': '9',
@@ -56,6 +55,7 @@ def onclick(event):
     """
     Click handler for weight gradient created by a CPPN. Will re-query with the clicked coordinate.
     """
+    import matplotlib.pyplot as plt
     plt.close()
     x = event.xdata
     y = event.ydata
@@ -73,6 +73,7 @@ def draw_pattern(im, res=60):
     """
     Draws the pattern/weight gradient queried by a CPPN.
     """
+    import matplotlib.pyplot as plt
     fig = plt.figure()
     plt.axis([-1, 1, -1, 1])
     fig.add_subplot(111)
@@ -97,6 +98,7 @@ def draw_es(id_to_coords, connections, filename):
     """
     Draw the net created by ES-HyperNEAT
     """
+    import matplotlib.pyplot as plt
     fig = plt.figure()
     plt.axis([-1.1, 1.1, -1.1, 1.1])
     fig.add_subplot(111)
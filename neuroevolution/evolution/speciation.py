@@ -3,6 +3,8 @@ import logging
 import random
 from typing import TYPE_CHECKING, Callable, Dict, List, Tuple, Set
 
+import numpy as np
+
 from neat.config import Config, ConfigParameter, DefaultClassConfig
 
 from neuroevolution.evolution.genome_distance_cache import GenomeDistanceCache
@@ -104,7 +106,7 @@ class Speciation(DefaultClassConfig):
         """
         unspeciated = self.species_set.get_unspeciated(population)
         if not unspeciated:
-            print("No unspeciated genomes found.")
+            logging.debug("No unspeciated genomes found.")
             return
 
         def distance_fn(id_a, id_b):
@@ -130,22 +132,40 @@ class Speciation(DefaultClassConfig):
         :param population: A dictionary mapping genome IDs to genomes.
         :param generation: The current generation number.
         """
+        distance_cache = self.distance_cache
+        threshold = self.compatibility_threshold
+
         def how_compatible(ga, gb) -> float:
-            if self.compatibility_threshold - self.distance_cache(ga, gb) < 0:
+            distance = distance_cache(ga, gb)
+            if distance > threshold:
                 return 0.0
-            else:
-                return self.distance_cache(ga, gb)
-            
-        for gid in self.species_set.get_unspeciated(population):
-            candidates = self.species_set.get_compatible_genomes(
-                gid, population, how_compatible)
-            try:
-                if candidates:
-                    _, best_species_id = min(candidates, key=lambda x: x[0])
-                    self.species_set.add_member(best_species_id, population[gid])
-                else:
-                    new_species_id = self.species_set.create_new_species(generation)
-                    self.species_set.add_member(new_species_id, population[gid])
-            except Exception as e:
-                logging.error("Error partitioning genome %s: %s", gid, e)
-                raise e
\ No newline at end of file
+            return distance
+
+        pending = sorted(self.species_set.get_unspeciated(population))
+        while pending:
+            residual = []
+            for gid in pending:
+                candidates = self.species_set.get_compatible_genomes(
+                    gid, population, how_compatible)
+                try:
+                    if candidates:
+                        compatibilities = np.fromiter(
+                            (candidate[0] for candidate in candidates),
+                            dtype=np.float64,
+                            count=len(candidates),
+                        )
+                        best_species_id = candidates[int(compatibilities.argmin())][1]
+                        self.species_set.add_member(best_species_id, population[gid])
+                    else:
+                        residual.append(gid)
+                except Exception as e:
+                    logging.error("Error partitioning genome %s: %s", gid, e)
+                    raise e
+            if not residual:
+                break
+            # No species could take the residual genomes; seed a new species
+            # with the first of them and re-test the rest against it in the
+            # next batched pass.
+            new_species_id = self.species_set.create_new_species(generation)
+            self.species_set.add_member(new_species_id, population[residual[0]])
+            pending = residual[1:]
\ No newline at end of file
@@ -70,7 +70,8 @@ class MixedGenerationSpecies:
         if genome_ids_to_consider is None:
             return [genome.fitness for _, genome in self.members.items()]
         else:
-            return [genome.fitness for genome_id, genome in self.members.items() if genome_id in genome_ids_to_consider]
+            consider = frozenset(genome_ids_to_consider)
+            return [genome.fitness for genome_id, genome in self.members.items() if genome_id in consider]
 
     def get_sorted_by_fitness(self, selected_genome_indices: List[int]) -> Members:
         """Sorts and pops the members with the given indices from the species."""
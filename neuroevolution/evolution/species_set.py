@@ -152,6 +152,13 @@ class MixedGenerationSpeciesSet():
         :param individual_id: An integer representing the ID of the genome.
         :return: The species ID to which the genome belongs, or None if it doesn't belong to any species.
         """
+        # O(1) fast path via the genome-to-species index; verified against
+        # the species because members can be killed without the index
+        # being told.
+        species_id = self.genome_to_species.get(individual_id)
+        if species_id is not None and species_id in self.species \
+                and self.species[species_id].is_member(individual_id):
+            return species_id
         for species_id, species in self.species.items():
             if species.is_member(individual_id):
                 return species_id
@@ -164,11 +171,12 @@ class MixedGenerationSpeciesSet():
     ) -> List[Tuple[float, int]]:
         """Returns a list of (compatibility, group_id) tuples for each group in groups."""
         comp_list = []
-        for species in self.get_all_species_objects():
+        genome = population[genome_id]
+        for species in self.species.values():
             rep = species.get_representative()
-            if not rep: 
+            if not rep:
                 rep = species.get_random_member()
-            how_compatible = compatibility_fn(population[rep.key], population[genome_id])
+            how_compatible = compatibility_fn(population[rep.key], genome)
             if how_compatible:
                 comp_list.append((how_compatible, species.key))
         return comp_list
@@ -1,8 +1,12 @@
 """Keeps track of whether species are making progress and helps remove ones that are not."""
 
+import logging
 import sys
+import weakref
 from typing import List, Tuple, Dict
 
+import numpy as np
+
 from neat.config import ConfigParameter, DefaultClassConfig, Config
 from neat.math_util import stat_functions
 
@@ -33,6 +37,11 @@ class MixedGenerationStagnation(DefaultClassConfig):
         self.stagnation_config = config
         self.species_fitness_func = self.set_fitness_func(config)
         self.reporters = reporters
+        # Keyed weakly by the species object itself: entries vanish with
+        # their species, so population resets or species-id reuse cannot
+        # serve a stale max, and the cache stays bounded by live species.
+        self.max_fitness_cache: "weakref.WeakKeyDictionary[MixedGenerationSpecies, float]" = \
+            weakref.WeakKeyDictionary()
 
     def set_fitness_func(self, config):
         """
@@ -55,9 +64,29 @@ class MixedGenerationStagnation(DefaultClassConfig):
         """
         species_data = self._update_fitness_history_for_species(
             species_set, genome_ids_to_consider, generation)
-        species_data.sort(key=lambda x: x[1].fitness)
+        species_data = self._argsort_by_fitness(species_data)
         result = self._identify_stagnant_species(species_data, generation)
         return result
+
+    @staticmethod
+    def _argsort_by_fitness(species_data: SpeciesData, descending: bool = False) -> SpeciesData:
+        """
+        Orders species data by fitness with a C-level argsort instead of a
+        Python comparator.
+
+        :param species_data: A list of tuples containing the species ID and the species instance.
+        :param descending: Whether to sort from best to worst fitness.
+        :return: A new list sorted by species fitness.
+        """
+        fitnesses = np.fromiter(
+            (species.fitness for _, species in species_data),
+            dtype=np.float64,
+            count=len(species_data),
+        )
+        if descending:
+            fitnesses = -fitnesses
+        order = np.argsort(fitnesses, kind="stable")
+        return [species_data[i] for i in order]
     
     def calculate_prev_fitness(self, species: MixedGenerationSpecies) -> float:
         """
@@ -66,6 +95,9 @@ class MixedGenerationStagnation(DefaultClassConfig):
         :param species: The species to get the previous fitness for.
         :return: The previous fitness of the species.
         """
+        cached = self.max_fitness_cache.get(species)
+        if cached is not None:
+            return cached
         return max(species.fitness_history) if species.fitness_history else -sys.float_info.max
     
     def update_species_fitness(self, species: MixedGenerationSpecies, evaluated_genome_ids):
@@ -78,8 +110,11 @@ class MixedGenerationStagnation(DefaultClassConfig):
         species.fitness = self.species_fitness_func(
             species.get_fitnesses(evaluated_genome_ids)
         )
-        print(f"appending {species.fitness}")
+        logging.debug("appending %s", species.fitness)
         species.fitness_history.append(species.fitness)
+        prev_max = self.max_fitness_cache.get(species)
+        if prev_max is None or species.fitness > prev_max:
+            self.max_fitness_cache[species] = species.fitness
         species.adjusted_fitness = None
 
     def _update_fitness_history_for_species(
@@ -100,7 +135,7 @@ class MixedGenerationStagnation(DefaultClassConfig):
         for sid, species in species_set.species.items():
             prev_fitness = self.calculate_prev_fitness(species)
             self.update_species_fitness(species, evaluated_genome_ids)
-            print(f"prev_fitness: {prev_fitness}, species.fitness: {species.fitness}")
+            logging.debug("prev_fitness: %s, species.fitness: %s", prev_fitness, species.fitness)
             if prev_fitness is None or species.fitness > prev_fitness:
                 species.last_improved = generation
             species_data.append((sid, species))
@@ -113,9 +148,7 @@ class MixedGenerationStagnation(DefaultClassConfig):
         :param species_data: A list of tuples containing the species ID and the species instance.
         :return: A list of tuples containing the species ID and the species instance, sorted by fitness.
         """
-        sorted_data = species_data.copy()
-        sorted_data.sort(key=lambda x: x[1].fitness, reverse=True)
-        return sorted_data
+        return self._argsort_by_fitness(species_data, descending=True)
     
     def _is_species_stagnant(self, species: MixedGenerationSpecies, generation: int, index: int, num_non_stagnant: int) -> bool:
         """
@@ -148,7 +181,7 @@ class MixedGenerationStagnation(DefaultClassConfig):
         sorted_data = self.sort_by_fitness(species_data) # to fascilitate species elitism
         for i, (species_id, species) in enumerate(sorted_data):
             is_stagnant = self._is_species_stagnant(species, generation, i, num_non_stagnant)
-            print(f"is_stagnant: {is_stagnant}, {species_id}")
+            logging.debug("is_stagnant: %s, %s", is_stagnant, species_id)
             if is_stagnant:
                 num_non_stagnant -= 1
             result.update({species_id: is_stagnant})
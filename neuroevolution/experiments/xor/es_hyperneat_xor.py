@@ -19,6 +19,11 @@ VERSION_TEXT = "small" if VERSION == "S" else "medium" if VERSION == "M" else "l
 XOR_INPUTS = [(0.0, 0.0), (0.0, 1.0), (1.0, 0.0), (1.0, 1.0)]
 XOR_OUTPUTS = [(0.0,), (1.0,), (1.0,), (0.0,)]
 
+# Bias-extended inputs paired with their expected output, built once at import
+# instead of re-zipped and re-concatenated for every genome.
+XOR_CASES = tuple((inputs + (1.0,), expected[0])
+                  for inputs, expected in zip(XOR_INPUTS, XOR_OUTPUTS))
+
 # Network coordinates and the resulting substrate.
 INPUT_COORDINATES = [(-1.0, -1.0), (0.0, -1.0), (1.0, -1.0)]
 OUTPUT_COORDINATES = [(0.0, 1.0)]
@@ -57,16 +62,18 @@ def eval_fitness(genomes, config):
         network = ESNetwork(SUBSTRATE, cppn, DYNAMIC_PARAMS)
         net = network.create_phenotype_network()
 
+        activate = net.activate
+        activations = network.activations
+
         sum_square_error = 0.0
 
-        for xor_inputs, xor_expected in zip(XOR_INPUTS, XOR_OUTPUTS):
-            new_xor_input = xor_inputs + (1.0,)
+        for new_xor_input, xor_expected in XOR_CASES:
             net.reset()
 
-            for _ in range(network.activations):
-                xor_output = net.activate(new_xor_input)
+            for _ in range(activations):
+                xor_output = activate(new_xor_input)
 
-            sum_square_error += ((xor_output[0] - xor_expected[0])**2.0)/4.0
+            sum_square_error += ((xor_output[0] - xor_expected)**2.0)/4.0
 
         genome.fitness = 1 - sum_square_error
 
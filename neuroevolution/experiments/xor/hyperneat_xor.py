@@ -15,6 +15,11 @@ from neuroevolution.evolution.hyperneat import create_phenotype_network
 XOR_INPUTS = [(0.0, 0.0), (0.0, 1.0), (1.0, 0.0), (1.0, 1.0)]
 XOR_OUTPUTS = [(0.0,), (1.0,), (1.0,), (0.0,)]
 
+# Bias-extended inputs paired with their expected output, built once at import
+# instead of re-zipped and re-concatenated for every genome.
+XOR_CASES = tuple((inputs + (1.0,), expected[0])
+                  for inputs, expected in zip(XOR_INPUTS, XOR_OUTPUTS))
+
 INPUT_COORDINATES = [(-1.0, -1.0), (0.0, -1.0), (1.0, -1.0)]
 HIDDEN_COORDINATES = [[(-1.0, 0.0), (0.0, 0.0), (1.0, 0.0)]]
 OUTPUT_COORDINATES = [(0.0, 1.0)]
@@ -38,16 +43,17 @@ def eval_fitness(genomes, config):
         cppn = neat.nn.FeedForwardNetwork.create(genome, config)
         net = create_phenotype_network(cppn, SUBSTRATE)
 
+        activate = net.activate
+
         sum_square_error = 0.0
 
-        for xor_inputs, xor_expected in zip(XOR_INPUTS, XOR_OUTPUTS):
-            new_xor_input = xor_inputs + (1.0,)
+        for new_xor_input, xor_expected in XOR_CASES:
             net.reset()
 
             for _ in range(ACTIVATIONS):
-                xor_output = net.activate(new_xor_input)
+                xor_output = activate(new_xor_input)
 
-            sum_square_error += ((xor_output[0] - xor_expected[0])**2.0)/4.0
+            sum_square_error += ((xor_output[0] - xor_expected)**2.0)/4.0
 
         genome.fitness = 1 - sum_square_error
 
@@ -13,6 +13,11 @@ from pureples.shared.visualize import draw_net
 XOR_INPUTS = [(0.0, 0.0), (0.0, 1.0), (1.0, 0.0), (1.0, 1.0)]
 XOR_OUTPUTS = [(0.0,), (1.0,), (1.0,), (0.0,)]
 
+# Bias-extended inputs paired with their expected output, built once at import
+# instead of re-zipped and re-concatenated for every genome.
+XOR_CASES = tuple((inputs + (1.0,), expected[0])
+                  for inputs, expected in zip(XOR_INPUTS, XOR_OUTPUTS))
+
 # Config for FeedForwardNetwork.
 CONFIG = neat.config.Config(neat.genome.DefaultGenome, neat.reproduction.DefaultReproduction,
                             neat.species.DefaultSpeciesSet, neat.stagnation.DefaultStagnation,
@@ -26,13 +31,13 @@ def eval_fitness(genomes, config):
     """
     for _, genome in genomes:
         net = neat.nn.FeedForwardNetwork.create(genome, config)
+        activate = net.activate
 
         sum_square_error = 0.0
 
-        for xor_inputs, xor_expected in zip(XOR_INPUTS, XOR_OUTPUTS):
-            new_xor_input = xor_inputs + (1.0,)
-            xor_output = net.activate(new_xor_input)
-            sum_square_error += ((xor_output[0] - xor_expected[0])**2.0)/4.0
+        for new_xor_input, xor_expected in XOR_CASES:
+            xor_output = activate(new_xor_input)
+            sum_square_error += ((xor_output[0] - xor_expected)**2.0)/4.0
 
         genome.fitness = 1 - sum_square_error
 
@@ -5,8 +5,13 @@ from neat.config import Config
 
 from neuroevolution.evolution.population_evolver import PopulationEvolver
 
-class BasicExperiment(ABC): 
+class BasicExperiment(ABC):
     """"Base class for running experiments."""
+    # Fixed attribute set: dropping the per-instance __dict__ shrinks each
+    # experiment and makes attribute access a slot read.
+    __slots__ = ("config_path", "config", "stop_experiment",
+                 "fitness_function", "evolver", "phenotype_creator")
+
     def __init__(self, config_path, genome_class, reproduction_class, speciation_class, stagnation_class):
         """Initialize the experiment."""
         self.config_path = config_path
@@ -50,14 +55,19 @@ class BasicExperiment(ABC):
     def start(self, num_generations: Optional[int] = None):
         """Run the population evolver until it terminates."""
         self.instanciate()
+        # Bind the loop body to locals once; the simulation loop runs for the
+        # whole experiment and pays these attribute lookups every iteration
+        # otherwise.
+        run_simulation = self.run_simulation
         if num_generations:
             if self.stop_experiment:
                 return
-            while self.evolver.get_current_generation() < num_generations:
-                self.run_simulation()
-        else: 
-            while not self.stop_experiment: 
-                self.run_simulation()
+            current_generation = self.evolver.get_current_generation
+            while current_generation() < num_generations:
+                run_simulation()
+        else:
+            while not self.stop_experiment:
+                run_simulation()
 
     def stop(self): 
         """Stop the population evolver."""
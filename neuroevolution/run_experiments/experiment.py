@@ -1,9 +1,10 @@
 """This module contains the Experiment class, which is used to run NEAT experiments."""
-from typing import Dict, Tuple, Optional
+import logging
+from typing import Dict, Tuple, Optional, TYPE_CHECKING
 import random
 
+import numpy as np
 from neat.genome import DefaultGenome
-from neat.nn.recurrent import RecurrentNetwork
 
 from neuroevolution.server.models import UserData
 from neuroevolution.run_experiments.basic_experiment import BasicExperiment
@@ -14,12 +15,21 @@ from neuroevolution.evolution.stagnation import MixedGenerationStagnation
 from neuroevolution.evolution.fitness_functions.user_evaluated_fitness import UserEvaluatedFitness
 from neuroevolution.evolution.phenotype_creator import PhenotypeCreator
 
+if TYPE_CHECKING:
+    from neat.nn.recurrent import RecurrentNetwork
+
 # Type aliases
 Genome = DefaultGenome
 Population = Dict[int, DefaultGenome]
 
+# How many simulated startup-time/rating values to draw per numpy batch.
+RANDOM_POOL_SIZE = 4096
+
 class SimulatedUserEvalExperiment(BasicExperiment):
     """Class for running experiments with user evaluation."""
+    __slots__ = ("iids_in_evaluation", "_rng",
+                 "_time_pool", "_rating_pool", "_random_pool_index")
+
     def __init__(self, config_path):
         super().__init__(
             config_path, 
@@ -29,6 +39,15 @@ class SimulatedUserEvalExperiment(BasicExperiment):
             stagnation_class=MixedGenerationStagnation
             )        
         self.iids_in_evaluation = []
+        # Dedicated RNG instance: skips the module-level singleton (shared
+        # state under threads) and makes per-experiment seeding possible.
+        self._rng = random.Random()
+        # Simulated evaluations draw two random ints each; refilling these
+        # pools in numpy batches replaces thousands of Python-level
+        # random.randint calls with one C-level fill per refill.
+        self._time_pool = None
+        self._rating_pool = None
+        self._random_pool_index = RANDOM_POOL_SIZE
 
     def create_fitness_function(self) -> UserEvaluatedFitness:
         """Create a fitness function."""
@@ -41,10 +60,9 @@ class SimulatedUserEvalExperiment(BasicExperiment):
     def create_phenotype_creator(self) -> PhenotypeCreator:
         return PhenotypeCreator(self.config)
     
-    def instanciate(self): 
+    def instanciate(self):
         self.evolver.create_new_population()
-        for i in range(10):
-            self.simulate_user_request()
+        self.simulate_user_requests(10)
 
     def run_simulation(self): 
         self.simulate_user_request()
@@ -54,8 +72,12 @@ class SimulatedUserEvalExperiment(BasicExperiment):
     def receive_evaluation(self, data: UserData):
         """Receive and process evaluation data for a genome."""
         self.evolver.handle_receive_user_data(data)
+        # An evaluated genome was already taken out of the available pool, so
+        # its cached network can never be served again; drop it to keep the
+        # cache bounded by the live population.
+        self.phenotype_creator.discard_cached_network(data.genome_id)
 
-    def get_random_individual(self) -> Tuple[int, RecurrentNetwork]:
+    def get_random_individual(self) -> Tuple[int, 'RecurrentNetwork']:
         """Create a random individual."""
         random_ind = self.evolver.return_random_individual()
         gid = random_ind.key
@@ -63,23 +85,47 @@ class SimulatedUserEvalExperiment(BasicExperiment):
     
     def simulate_user_evaluation(self) -> UserData:
         """Create a random user evaluation within a range."""
-        received = random.choice(self.iids_in_evaluation)
-        print(f"iids in evaluation: {self.iids_in_evaluation}")
-        self.iids_in_evaluation.remove(received)
-        return UserData(
+        # Swap the drawn id with the last entry and pop, so removal is O(1)
+        # instead of random.choice + remove's linear scan and shift.
+        index = self._rng.randrange(len(self.iids_in_evaluation))
+        received = self.iids_in_evaluation[index]
+        self.iids_in_evaluation[index] = self.iids_in_evaluation[-1]
+        self.iids_in_evaluation.pop()
+        logging.debug("iids in evaluation: %s", self.iids_in_evaluation)
+        time_since_startup, user_rating = self._next_simulated_values()
+        # model_construct skips validation; these values are generated here
+        # and already satisfy the field types, unlike real user payloads
+        # which are validated at the FastAPI boundary.
+        return UserData.model_construct(
             genome_id = received,
-            time_since_startup = random.randint(0, 1000),
-            user_rating = random.randint(0, 5),
+            time_since_startup = float(time_since_startup),
+            user_rating = user_rating,
             last_message = None,
             last_message_time = None,
             last_response = None,
             last_response_time = None,
         )
 
-    def simulate_user_request(self): 
+    def _next_simulated_values(self) -> Tuple[int, int]:
+        """Return the next (time_since_startup, user_rating) pair from the pools."""
+        index = self._random_pool_index
+        if index >= RANDOM_POOL_SIZE:
+            self._time_pool = np.random.randint(0, 1001, size=RANDOM_POOL_SIZE)
+            self._rating_pool = np.random.randint(0, 6, size=RANDOM_POOL_SIZE)
+            index = 0
+        self._random_pool_index = index + 1
+        return int(self._time_pool[index]), int(self._rating_pool[index])
+
+    def simulate_user_request(self):
         iid = (self.get_random_individual())[0]
         self.iids_in_evaluation.append(iid)
 
+    def simulate_user_requests(self, count: int) -> None:
+        """Hand out a batch of individuals in one pass."""
+        individuals = [self.evolver.return_random_individual() for _ in range(count)]
+        self.phenotype_creator.create_networks_from_genomes(individuals)
+        self.iids_in_evaluation.extend(individual.key for individual in individuals)
+
     
 
 
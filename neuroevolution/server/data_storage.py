@@ -1,6 +1,7 @@
 # neuroevolution/pureples/shared/data_storage.py
 from typing import TYPE_CHECKING
 import csv
+import os
 from neuroevolution.server.models import UserData
 
 if TYPE_CHECKING:
@@ -10,16 +11,27 @@ if TYPE_CHECKING:
 class SessionData:
     def __init__(self, filename):
         self.filename = filename
+        self._csvfile = None
+        self._writer = None
 
     def store_session_data(self, data: 'UserData'):
-        # Check if file exists
-        try:
-            with open(self.filename, 'x', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(UserData.__annotations__.keys())
-                writer.writerow(data.model_dump().values())  # Write values as data
-        except FileExistsError:
-            # If file exists, append data
-            with open(self.filename, 'a', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(data.model_dump().values())  # Write values as data
\ No newline at end of file
+        # Dump the model once; header and values come from the same dict so
+        # the columns always line up.
+        row = data.model_dump()
+        if self._writer is None:
+            # Open the file once in append mode and keep streaming rows to
+            # it, instead of probing with an 'x' open (and paying an
+            # exception plus a reopen) on every call.
+            is_new = not os.path.exists(self.filename) or os.path.getsize(self.filename) == 0
+            self._csvfile = open(self.filename, 'a', newline='')
+            self._writer = csv.writer(self._csvfile)
+            if is_new:
+                self._writer.writerow(row.keys())
+        self._writer.writerow(row.values())
+        self._csvfile.flush()
+
+    def close(self):
+        if self._csvfile is not None:
+            self._csvfile.close()
+            self._csvfile = None
+            self._writer = None
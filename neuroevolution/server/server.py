@@ -1,9 +1,18 @@
-from fastapi import FastAPI, BackgroundTasks, HTTPException
+import asyncio
+import logging
+
+from fastapi import FastAPI, HTTPException, Response
 from .models import UserData
-from .tasks import process_user_data, swap_out_mediator, run_evolution, reset_population
+from .tasks import (process_user_data, swap_out_mediator, swap_out_mediator_raw,
+                    run_evolution, reset_population, submit_evolution_task)
 from .config import Config
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+# Upper bound on buffered, unprocessed user payloads; past this the server
+# sheds load with a 503 instead of growing without bound.
+USER_DATA_QUEUE_MAX = 1024
 
 class ResponseModel(BaseModel):
     new_mediator: str
@@ -11,27 +20,71 @@ class ResponseModel(BaseModel):
 
 app = FastAPI()
 
+async def _drain_user_data(queue: asyncio.Queue) -> None:
+    """Consume queued user data, one payload at a time, off the event loop."""
+    while True:
+        data = await queue.get()
+        try:
+            await run_in_threadpool(process_user_data, data)
+        except Exception:
+            logging.exception("Failed to process user data for genome %s", data.genome_id)
+        finally:
+            queue.task_done()
+
+def _ensure_user_data_worker() -> asyncio.Queue:
+    """Return the ingestion queue, creating it and its drain task lazily.
+
+    The queue and its drain task are bound to the loop they were created
+    on; created lazily per loop so this also works under the test client,
+    which may run requests on short-lived loops.
+    """
+    loop = asyncio.get_running_loop()
+    if getattr(app.state, "user_data_loop", None) is not loop:
+        app.state.user_data_loop = loop
+        app.state.user_data_queue = asyncio.Queue(maxsize=USER_DATA_QUEUE_MAX)
+        app.state.user_data_worker = loop.create_task(
+            _drain_user_data(app.state.user_data_queue))
+    return app.state.user_data_queue
+
 @app.post("/user_data")
-async def receive_user_data(user_data: UserData, background_tasks: BackgroundTasks):
-    background_tasks.add_task(process_user_data, user_data)
+async def receive_user_data(user_data: UserData):
+    # Enqueue and return immediately: BackgroundTasks ran the processing
+    # after the response but still serially per request, with no bound on
+    # in-flight work. The queue decouples ingestion from processing and
+    # gives an explicit overload signal.
+    queue = _ensure_user_data_worker()
+    try:
+        queue.put_nowait(user_data)
+    except asyncio.QueueFull:
+        raise HTTPException(status_code=503, detail="Server is overloaded, try again later")
     return {"message": "Data received successfully"}
 
 @app.post("/request_new_mediator")
-async def request_new_mediator(user_data: UserData, background_tasks: BackgroundTasks):
+async def request_new_mediator(user_data: UserData):
     new_mediator = swap_out_mediator(user_data)
     if new_mediator:
         return JSONResponse(status_code=200, content=ResponseModel(new_mediator=new_mediator, message="New mediator generated successfully").model_dump())
     else:
         raise HTTPException(status_code=500, detail="Failed to generate new mediator genome")
 
+@app.post("/request_new_mediator_raw")
+async def request_new_mediator_raw(user_data: UserData):
+    # Raw pickle bytes in the body: no base64 inflation and no JSON framing,
+    # for clients that can consume a binary response directly.
+    new_mediator = swap_out_mediator_raw(user_data)
+    if new_mediator:
+        return Response(content=new_mediator, media_type="application/octet-stream")
+    else:
+        raise HTTPException(status_code=500, detail="Failed to generate new mediator genome")
+
 @app.post("/start_evolution")
-async def start_evolution(background_tasks: BackgroundTasks):
-    background_tasks.add_task(run_evolution)
+async def start_evolution():
+    submit_evolution_task(run_evolution)
     return {"message": "Evolution process started"}
 
 @app.post("/restart_population")
-async def restart_population(background_tasks: BackgroundTasks):
-    background_tasks.add_task(reset_population)
+async def restart_population():
+    submit_evolution_task(reset_population)
     return {"message": "Population reset"}
 
 if __name__ == "__main__":
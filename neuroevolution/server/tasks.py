@@ -1,5 +1,6 @@
 # neuroevolution/server/tasks.py
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 from neuroevolution.evolution.networker import Network
 from neuroevolution.run_experiments.experiment import SimulatedUserEvalExperiment
@@ -17,25 +18,46 @@ experiment = SimulatedUserEvalExperiment('neuroevolution/evolution/config_cppn_s
 network = Network(experiment)
 session_data = SessionData('session_data.csv')
 
+# Evolution runs are long-lived, CPU-heavy loops. A dedicated single-worker
+# executor keeps them off the request threadpool (so serving stays
+# responsive while a run is active) and serializes them, so two runs never
+# mutate the population concurrently.
+evolution_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="evolution")
+
+def _log_evolution_failure(future):
+    exc = future.exception()
+    if exc is not None:
+        logging.error("Evolution task failed: %s", exc)
+
+def submit_evolution_task(task) -> None:
+    """Run an evolution task on the dedicated executor, logging failures."""
+    evolution_executor.submit(task).add_done_callback(_log_evolution_failure)
+
 def process_user_data(data: 'UserData'):
-    logging.info(f"Processing user data: {data}")
+    logging.info("Processing user data: %s", data)
     session_data.store_session_data(data)
     network.receive_evaluation(data)
-    logging.info(f"User data processed: {data}")
+    logging.info("User data processed: %s", data)
 
-def swap_out_mediator(user_data: 'UserData') -> bytes:
-    logging.info(f"Requesting new mediator genome for mediator ID: {user_data.genome_id}")
+def _swap_out_mediator(user_data: 'UserData', fetch_mediator):
+    logging.info("Requesting new mediator genome for mediator ID: %s", user_data.genome_id)
     session_data.store_session_data(user_data)
-    logging.info(f"User data stored: {user_data}")
+    logging.info("User data stored: %s", user_data)
     network.receive_evaluation(user_data)
-    logging.info(f"User data evaluated: {user_data}"[:100])
-    new_mediator = network.get_serialized_mediator()
+    logging.info("User data evaluated: %.100s", user_data)
+    new_mediator = fetch_mediator()
     if not new_mediator:
         logging.error("Failed to fetch new genome")
         raise MissingGenomeError("Failed to fetch new genome")
-    logging.info(f"New mediator provided.")
+    logging.info("New mediator provided.")
     return new_mediator
 
+def swap_out_mediator(user_data: 'UserData') -> str:
+    return _swap_out_mediator(user_data, network.get_serialized_mediator)
+
+def swap_out_mediator_raw(user_data: 'UserData') -> bytes:
+    return _swap_out_mediator(user_data, network.get_pickled_mediator)
+
 def run_evolution():
     logging.info("Starting the evolutionary process")
     experiment.start()
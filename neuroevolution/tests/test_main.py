@@ -1,6 +1,9 @@
 # tests/test_main.py
+import asyncio
 from fastapi.testclient import TestClient
+from neuroevolution.server import server as server_module
 from neuroevolution.server.server import app
+from neuroevolution.server.tasks import evolution_executor, experiment
 import logging, pytest, random, pickle, neat, base64
 from neuroevolution.evolution.phenotype_creator import PhenotypeCreator
 
@@ -21,6 +24,13 @@ def test_receive_user_data_missing_fields():
     response = client.post("/user_data", json={"genome_id": 1})
     assert response.status_code == 422  # Unprocessable Entity
 
+def test_receive_user_data_overloaded(monkeypatch):
+    full_queue = asyncio.Queue(maxsize=1)
+    full_queue.put_nowait(None)
+    monkeypatch.setattr(server_module, "_ensure_user_data_worker", lambda: full_queue)
+    response = client.post("/user_data", json={"genome_id": 1, "time_since_startup": 123.45, "user_rating": 4})
+    assert response.status_code == 503  # Service Unavailable
+
 def test_request_new_mediator():
     response = client.post("/restart_population")
     response = client.post("/request_new_mediator", json={"genome_id": 1, "time_since_startup": 123.45, "user_rating": 4})
@@ -48,7 +58,26 @@ def test_request_new_mediator_missing_fields():
     response = client.post("/restart_population")
     response = client.post("/request_new_mediator", json={"mediator_id": 1})
     assert response.status_code == 422  # Unprocessable Entity
- 
+
+def test_request_new_mediator_raw():
+    response = client.post("/restart_population")
+    # The reset runs on the single-worker evolution executor; waiting on a
+    # no-op submitted after it guarantees the fresh population is in place.
+    evolution_executor.submit(lambda: None).result()
+    genome_id = experiment.iids_in_evaluation[-1]
+    response = client.post("/request_new_mediator_raw", json={"genome_id": genome_id, "time_since_startup": 123.45, "user_rating": 4})
+    assert response.status_code == 200, "Response status code is not 200"
+    assert response.headers["content-type"] == "application/octet-stream"
+    try:
+        new_genome_id, deserialized_object = pickle.loads(response.content)
+    except pickle.UnpicklingError:
+        assert False, "response body is not a valid serialized object"
+    assert isinstance(deserialized_object, neat.nn.RecurrentNetwork), "new_mediator is not a RecurrentNetwork object"
+
+def test_request_new_mediator_raw_invalid():
+    response = client.post("/request_new_mediator_raw", json={"mediator_id": "invalid", "session_data": "invalid"})
+    assert response.status_code == 422  # Unprocessable Entity
+
 def pre_make_individuals(pre_made_individuals : int):
     for i in range(pre_made_individuals):
         logging.info(f"Creating individual {i + 1}")